@@ -3,7 +3,7 @@ Simple lambda which registers data against a Simiotics Data Registry
 """
 
 import os
-from typing import Dict, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import uuid
 
 from simiotics.client import client_from_env, Simiotics
@@ -24,6 +24,141 @@ class RegistrationError(IOError):
     Raised if datum registration failed
     """
 
+SimioticsClient: Optional[Simiotics] = None
+
+def get_simiotics_client() -> Simiotics:
+    """
+    Returns a Simiotics client configured from the environment. The client is created on first use
+    and reused thereafter, so that its gRPC channels stay open across warm invocations.
+
+    Args: None
+
+    Returns: Simiotics client
+    """
+    global SimioticsClient
+    if SimioticsClient is None:
+        SimioticsClient = client_from_env()
+    return SimioticsClient
+
+DataSources: Dict[str, data_pb2.Source] = {}
+
+def get_data_source(simiotics_client: Simiotics, source_id: str) -> data_pb2.Source:
+    """
+    Retrieves a source from the Simiotics Data Registry. Sources are cached for the lifetime of the
+    process, as the data registry is fixed by the environment and a source does not change once it
+    has been registered - this saves a round trip to the registry on every warm invocation.
+
+    Args:
+    simiotics_client
+        Simiotics client with an initialized data registry
+    source_id
+        ID of the source to retrieve
+
+    Returns: Source object
+    """
+    source = DataSources.get(source_id)
+    if source is None:
+        source = simiotics_client.get_data_source(source_id)
+        DataSources[source_id] = source
+    return source
+
+def validate_source(simiotics_client: Simiotics, source_id: str, object_paths: List[str]) -> None:
+    """
+    Checks that the given source is an S3 data source whose data_access_spec is a prefix of each of
+    the given object paths
+
+    Args:
+    simiotics_client
+        Simiotics client with an initialized data registry
+    source_id
+        ID of the source under which the objects are to be registered
+    object_paths
+        Paths of the form `s3://{bucket}/{key}` of the objects to be registered
+
+    Returns: None, raises InvalidSource if the source does not match the objects
+    """
+    source = get_data_source(simiotics_client, source_id)
+    for object_path in object_paths:
+        if source.data_access_spec != object_path[:len(source.data_access_spec)]:
+            raise InvalidSource(
+                (
+                    f'Source data access specification ({source.data_access_spec}) does not match '
+                    f'object path ({object_path})'
+                )
+            )
+    if source.source_type != data_pb2.Source.SOURCE_S3:
+        raise InvalidSource(
+            f'Source {source_id} has type {source.source_type} not {data_pb2.Source.SOURCE_S3}'
+        )
+
+def iter_register_objects(
+        objects: List[Tuple[str, str, Dict[str, str]]],
+    ) -> Iterator[Tuple[str, str]]:
+    """
+    Registers objects stored to S3 against a Simiotics Data Registry in a single batch, yielding
+    the result for each object as soon as the registry responds to it. The same conditions apply as
+    for register_object, and the source is only looked up once per batch.
+
+    Args:
+    objects
+        List of (bucket, key, tags) triples, each describing an object to be registered as per the
+        arguments of register_object
+
+    Returns: Iterator over ordered pairs of the form (data source ID, datum ID), in the same order as
+    the objects that were passed in
+    """
+    if not objects:
+        return
+
+    source_id = os.environ.get('SIMIOTICS_DATA_SOURCE')
+    if source_id is None:
+        raise InvalidEnvironment('SIMIOTICS_DATA_SOURCE environment variable has not been set')
+
+    if os.environ.get('SIMIOTICS_DATA_REGISTRY') is None:
+        raise InvalidEnvironment('SIMIOTICS_DATA_REGISTRY environment variable has not been set')
+
+    simiotics_client = get_simiotics_client()
+
+    # Datum IDs are random (version 4) UUIDs, drawn from a single read of the OS random source
+    # rather than one per object
+    random_bytes = os.urandom(16 * len(objects))
+    samples = [
+        (
+            source_id,
+            str(uuid.UUID(bytes=random_bytes[16*i:16*(i+1)], version=4)),
+            f's3://{bucket}/{key}',
+            tags,
+        )
+        for i, (bucket, key, tags) in enumerate(objects)
+    ]
+
+    validate_source(simiotics_client, source_id, [object_path for _, _, object_path, _ in samples])
+
+    num_responses = 0
+    for response in simiotics_client.register_data(samples):
+        if response.error:
+            raise RegistrationError(response.error_message)
+        num_responses += 1
+        yield (source_id, response.datum.id)
+
+    if num_responses != len(samples):
+        raise RegistrationError(f'Expected {len(samples)} responses; got {num_responses}')
+
+def register_objects(objects: List[Tuple[str, str, Dict[str, str]]]) -> List[Tuple[str, str]]:
+    """
+    Registers objects stored to S3 against a Simiotics Data Registry in a single batch. See
+    iter_register_objects for details.
+
+    Args:
+    objects
+        List of (bucket, key, tags) triples, each describing an object to be registered as per the
+        arguments of register_object
+
+    Returns: List of ordered pairs of the form (data source ID, datum ID), in the same order as the
+    objects that were passed in
+    """
+    return list(iter_register_objects(objects))
+
 def register_object(bucket: str, key: str, tags: Dict[str, str]) -> Tuple[str, str]:
     """
     Registers an object stored to S3 against a Simiotics Data Registry provided:
@@ -48,40 +183,7 @@ def register_object(bucket: str, key: str, tags: Dict[str, str]) -> Tuple[str, s
     Returns: Ordered pair of the form (data source ID, datum ID) to identify the data registered in
     the Simiotics Data Registry
     """
-    source_id = os.environ.get('SIMIOTICS_DATA_SOURCE')
-    if source_id is None:
-        raise InvalidEnvironment('SIMIOTICS_DATA_SOURCE environment variable has not been set')
-
-    if os.environ.get('SIMIOTICS_DATA_REGISTRY') is None:
-        raise InvalidEnvironment('SIMIOTICS_DATA_REGISTRY environment variable has not been set')
-
-    simiotics_client = client_from_env()
-
-    datum_id = str(uuid.uuid4())
-    object_path = f's3://{bucket}/{key}'
-
-    source = simiotics_client.get_data_source(source_id)
-    if source.data_access_spec != object_path[:len(source.data_access_spec)]:
-        raise InvalidSource(
-            (
-                f'Source data access specification ({source.data_access_spec}) does not match '
-                f'object path ({object_path})'
-            )
-        )
-    if source.source_type != data_pb2.Source.SOURCE_S3:
-        raise InvalidSource(
-            f'Source {source_id} has type {source.source_type} not {data_pb2.Source.SOURCE_S3}'
-        )
-
-    responses = list(simiotics_client.register_data([(source_id, datum_id, object_path, tags)]))
-    if len(responses) != 1:
-        raise RegistrationError(f'Expected single response; got {responses}')
-
-    response = responses[0]
-    if response.error:
-        raise RegistrationError(response.error_message)
-
-    return (source_id, response.datum.id)
+    return register_objects([(bucket, key, tags)])[0]
 
 def manual_trigger(event: Dict, context: Dict) -> Tuple[str, str]:
     """
@@ -91,7 +193,7 @@ def manual_trigger(event: Dict, context: Dict) -> Tuple[str, str]:
     """
     return register_object(**event)
 
-def s3_trigger(event: Dict, context: Dict) -> Tuple[str, str]:
+def s3_trigger(event: Dict, context: Dict) -> List[Tuple[str, str]]:
     """
     Trigger for when S3 object gets created - this allows auto-registration of new S3 objects
     against a Simiotics Data Registry.
@@ -99,23 +201,18 @@ def s3_trigger(event: Dict, context: Dict) -> Tuple[str, str]:
     The assumption is that the event argument is structured as per:
     https://docs.aws.amazon.com/lambda/latest/dg/with-s3.html
 
+    All records in the event are registered against the data registry in a single batch.
     """
-    records = event.get('Records', [])
-    arguments = [
-        (
-            record.get('s3', {}).get('bucket', {}).get('name'),
-            record.get('s3', {}).get('object', {}).get('key'),
-            {
-                'creator': 'lambada',
-            },
-        )
-        for record in records
-    ]
-    responses = [
-        register_object(bucket, key, tags) for bucket, key, tags in arguments
-        if bucket is not None and key is not None
-    ]
-    return responses
+    arguments = []
+    for record in event.get('Records', []):
+        s3 = record.get('s3')
+        if not s3:
+            continue
+        bucket = (s3.get('bucket') or {}).get('name')
+        key = (s3.get('object') or {}).get('key')
+        if bucket is not None and key is not None:
+            arguments.append((bucket, key, {'creator': 'lambada'}))
+    return register_objects(arguments)
 
 if __name__ == '__main__':
     import argparse
@@ -163,6 +163,16 @@ $ export SIMIOTICS_FUNCTION_REGISTRY=registry-alpha.simiotics.com:7011
         required=True,
         help='Key for function in Simiotics Function Registry',
     )
+    deploy.add_argument(
+        '--staging-bucket',
+        type=str,
+        default=None,
+        help=(
+            'S3 bucket to upload the deployment package to before creating the AWS Lambda. The '
+            'bucket must be in the same region as the Lambda. If not set, the deployment package '
+            'is sent directly with the create function request, which limits it to 50 MB.'
+        ),
+    )
     deploy.add_argument(
         '--keep-staging-dir',
         action='store_true',
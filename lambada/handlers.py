@@ -3,6 +3,7 @@ Handlers for lambada commands
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import copy
 import json
 import os
@@ -10,12 +11,17 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import zipfile
 
-from typing import Dict
+from typing import Any, Dict
 
-import boto3
 from simiotics.client import client_from_env
 
+try:
+    from zlib_ng import zlib_ng
+except ImportError:
+    zlib_ng = None
+
 LambdaExecutionRolePolicyDict = {
     "Version": "2012-10-17",
     "Statement": [
@@ -51,6 +57,62 @@ SimioticsPath = '/simiotics/'
 LambadaManagerKey = 'manager'
 LambadaManager = 'lambada'
 
+AWSClients: Dict[str, Any] = {}
+
+def _aws_client(service_name: str) -> Any:
+    """
+    Returns a boto3 client for the given AWS service. Clients are created on first use and reused
+    thereafter, so that their connection pools are shared across calls
+
+    Args:
+    service_name
+        Name of the AWS service (e.g. 'iam', 'lambda', 's3')
+
+    Returns: boto3 client for the given service
+    """
+    client = AWSClients.get(service_name)
+    if client is None:
+        # boto3 is imported here rather than at module level because it is slow to import and
+        # several commands (e.g. register, list) never talk to AWS
+        import boto3
+        from botocore.config import Config
+
+        client = boto3.client(service_name, config=Config(max_pool_connections=32))
+        AWSClients[service_name] = client
+    return client
+
+def _build_deployment_package(deployment_package_dir: str, zipfilepath: str) -> None:
+    """
+    Zips up the contents of a deployment package directory. If zlib-ng is installed, it is used in
+    place of zlib to compress the package, as it is considerably faster on large packages.
+
+    Args:
+    deployment_package_dir
+        Path to directory containing the function code and its dependencies
+    zipfilepath
+        Path at which the deployment package should be written
+
+    Returns: None
+    """
+    original_zlib = zipfile.zlib
+    if zlib_ng is not None:
+        zipfile.zlib = zlib_ng
+    try:
+        # Lambda does not care how well the package is compressed beyond the upload size limits, so
+        # the fastest compression level is used
+        with zipfile.ZipFile(
+                zipfilepath,
+                'w',
+                compression=zipfile.ZIP_DEFLATED,
+                compresslevel=1,
+            ) as zf:
+            for root, _, filenames in os.walk(deployment_package_dir):
+                for filename in filenames:
+                    filepath = os.path.join(root, filename)
+                    zf.write(filepath, os.path.relpath(filepath, deployment_package_dir))
+    finally:
+        zipfile.zlib = original_zlib
+
 def register(args: argparse.Namespace) -> None:
     """
     Handler for `lambada register`, which registers a new lambada function against a simiotics
@@ -142,12 +204,19 @@ def create_role(args: argparse.Namespace) -> None:
 
     Returns: None, prints IAM role name
     """
-    simiotics = client_from_env()
-    registered_function = simiotics.get_registered_function(args.key)
-    if registered_function.tags.get(LambadaManagerKey) != LambadaManager:
-        raise ValueError('Simiotics function with key={} not managed by lambada'.format(args.key))
+    # The IAM role must not be created before the function is known to be managed by lambada, but
+    # the IAM client (which is slow to set up) can be built while the function is being fetched
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        iam_client_future = executor.submit(_aws_client, 'iam')
+
+        simiotics = client_from_env()
+        registered_function = simiotics.get_registered_function(args.key)
+        if registered_function.tags.get(LambadaManagerKey) != LambadaManager:
+            raise ValueError(
+                'Simiotics function with key={} not managed by lambada'.format(args.key)
+            )
 
-    iam_client = boto3.client('iam')
+        iam_client = iam_client_future.result()
 
     response = iam_client.create_role(
         Path=SimioticsPath,
@@ -210,38 +279,58 @@ def deploy(args: argparse.Namespace) -> None:
         with open(requirements_txt, 'w') as ofp:
             ofp.write(registered_function.tags['requirements'])
 
-        subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "-r",
-                requirements_txt,
-                "--target",
-                deployment_package_dir
-            ],
-            check=True,
-        )
+        pip_command = [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "-r",
+            requirements_txt,
+            "--target",
+            deployment_package_dir
+        ]
+        # pip install spends most of its time waiting on the network, so the rest of the deployment
+        # is prepared while it runs
+        pip_process = subprocess.Popen(pip_command)
+        try:
+            staged_code_py = os.path.join(staging_dir, 'code.py')
+            with open(staged_code_py, 'w') as ofp:
+                ofp.write(registered_function.code)
+
+            lambda_client = _aws_client('lambda')
+            if args.staging_bucket is not None:
+                s3_client = _aws_client('s3')
+        except BaseException:
+            pip_process.kill()
+            raise
+        finally:
+            pip_process.wait()
+        if pip_process.returncode != 0:
+            raise subprocess.CalledProcessError(pip_process.returncode, pip_command)
+
         if os.path.exists(code_py):
             raise ValueError('File already exists at path: {}'.format(code_py))
-
-        with open(code_py, 'w') as ofp:
-            ofp.write(registered_function.code)
+        os.replace(staged_code_py, code_py)
 
         zipfilepath = os.path.join(staging_dir, 'function.zip')
-        shutil.make_archive(os.path.splitext(zipfilepath)[0], 'zip', deployment_package_dir)
-        with open(zipfilepath, 'rb') as ifp:
-            deployment_package = ifp.read()
+        _build_deployment_package(deployment_package_dir, zipfilepath)
+        if args.staging_bucket is not None:
+            # upload_file streams the package from disk (in parts, if it is large) rather than
+            # holding it in memory
+            staging_key = 'lambada/{}/function.zip'.format(args.key)
+            s3_client.upload_file(zipfilepath, args.staging_bucket, staging_key)
+            code = {'S3Bucket': args.staging_bucket, 'S3Key': staging_key}
+        else:
+            with open(zipfilepath, 'rb') as ifp:
+                code = {'ZipFile': ifp.read()}
 
-        lambda_client = boto3.client('lambda')
         handler_path = 'code.{}'.format(registered_function.tags['handler'])
         lambda_resource = lambda_client.create_function(
             FunctionName=args.name,
             Runtime=registered_function.tags['runtime'],
             Role=registered_function.tags['iam_role_arn'],
             Handler=handler_path,
-            Code={'ZipFile': deployment_package},
+            Code=code,
             Environment={
                 'Variables': environment_variables,
             },
@@ -284,7 +373,7 @@ def deploy(args: argparse.Namespace) -> None:
             's3_notification_configurations'
         )
         if s3_notification_configurations_str is not None:
-            s3_client = boto3.client('s3')
+            s3_client = _aws_client('s3')
             s3_notification_configurations = json.loads(s3_notification_configurations_str)
             for notification_conf in s3_notification_configurations:
                 bucket = notification_conf['Bucket']
@@ -324,7 +413,7 @@ def down(args: argparse.Namespace) -> None:
     try:
         lambda_arn = registered_function.tags.get('lambda_arn')
         if lambda_arn is not None:
-            lambda_client = boto3.client('lambda')
+            lambda_client = _aws_client('lambda')
             s3_sid = registered_function.tags.get('s3_sid')
             if s3_sid is not None:
                 lambda_client.remove_permission(
@@ -336,7 +425,7 @@ def down(args: argparse.Namespace) -> None:
             registered_function.tags.pop('lambda_arn')
 
         if args.teardown:
-            iam_client = boto3.client('iam')
+            iam_client = _aws_client('iam')
             role_name = registered_function.tags.get('iam_role_name')
             if role_name is not None:
                 policy_name = registered_function.tags.get('iam_role_policy')
@@ -14,6 +14,9 @@ setup(
         'boto3',
         'simiotics',
     ],
+    extras_require={
+        'zlib-ng': ['zlib-ng'],
+    },
     description='Manage AWS Lambda functions using a Simiotics Function Registry',
     long_description=long_description,
     long_description_content_type="text/markdown",